@@ -1,8 +1,10 @@
 import os
-import psycopg2
 import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.patheffects as pe
+
+# matplotlib y psycopg2 se importan de forma perezosa (ver use_theme / get_connection)
+# para que exportar solo los CSV de KPIs no pague el costo de cargar matplotlib.
+plt = None
+pe = None
 
 # =========================
 # Config DB (PostgreSQL)
@@ -41,17 +43,28 @@ COUNTRY_COLORS = {
     "Ecuador": NEON_PINK
 }
 
-plt.rcParams.update({
-    "figure.facecolor": BG,
-    "axes.facecolor": PANEL,
-    "axes.edgecolor": GRID,
-    "axes.labelcolor": TEXT,
-    "xtick.color": TEXT,
-    "ytick.color": TEXT,
-    "text.color": TEXT,
-    "font.size": 11,
-    "axes.titleweight": "bold",
-})
+
+def use_theme():
+    global plt, pe
+    if plt is not None:
+        return
+
+    import matplotlib.pyplot as _plt
+    import matplotlib.patheffects as _pe
+    plt, pe = _plt, _pe
+
+    plt.rcParams.update({
+        "figure.facecolor": BG,
+        "axes.facecolor": PANEL,
+        "axes.edgecolor": GRID,
+        "axes.labelcolor": TEXT,
+        "xtick.color": TEXT,
+        "ytick.color": TEXT,
+        "text.color": TEXT,
+        "font.size": 11,
+        "axes.titleweight": "bold",
+    })
+
 
 # =========================
 # DB helpers
@@ -60,6 +73,7 @@ def get_connection():
     if not DB_CONFIG["password"]:
         raise ValueError("PGPASSWORD no está definida.")
 
+    import psycopg2
     return psycopg2.connect(**DB_CONFIG)
 
 
@@ -182,6 +196,31 @@ FROM fact_application
 WHERE is_hired = TRUE;
 """
 
+# (query, archivo CSV) para el export rápido de KPIs (sin gráficas)
+KPI_EXPORTS = [
+    (Q1_TECH, "kpi_1_hires_by_technology.csv"),
+    (Q2_YEAR, "kpi_2_hires_by_year.csv"),
+    (Q3_SEN, "kpi_3_hires_by_seniority.csv"),
+    (Q4_COUNTRY, "kpi_4_hires_by_country_over_years.csv"),
+    (Q5_HIRERATE, "kpi_5_hire_rate.csv"),
+    (Q6_AVG, "kpi_6_avg_scores_hired.csv"),
+]
+
+
+# =========================
+# KPI CSV export (sin matplotlib)
+# =========================
+def export_kpis():
+    os.makedirs(PROCESSED_DIR, exist_ok=True)
+
+    # Una sola conexión para todas las queries
+    conn = get_connection()
+    try:
+        for query, filename in KPI_EXPORTS:
+            save_csv(pd.read_sql(query, conn), filename)
+    finally:
+        conn.close()
+
 
 # =========================
 # KPI 1 — Hires by Technology (Top 15)
@@ -419,8 +458,9 @@ def plot_dashboard():
     print(f"Saved: {path}")
 
 
-def main():
+def render():
     ensure_dirs()
+    use_theme()
 
     plot_kpi_1()
     plot_kpi_2()
@@ -434,5 +474,9 @@ def main():
     print("All KPI tables exported to /data/processed")
 
 
+def main():
+    render()
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
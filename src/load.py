@@ -1,6 +1,3 @@
-import psycopg2
-from psycopg2.extras import execute_values
-
 #Recomendación: más adelante guardamos esto en un .env, pero hoy lo dejamos simple
 DB_CONFIG = {
     "host": "localhost",
@@ -11,9 +8,13 @@ DB_CONFIG = {
 }
 
 def get_connection():
+    # Import perezoso: psycopg2 solo se carga cuando de verdad vamos a la BD
+    import psycopg2
     return psycopg2.connect(**DB_CONFIG)
 
 def load_to_dw(dim_candidate, dim_country, dim_date, dim_seniority, dim_technology, fact_raw):
+    from psycopg2.extras import execute_values
+
     conn = get_connection()
     cur = conn.cursor()
 
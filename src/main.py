@@ -1,12 +1,52 @@
-from extract import extract
-from transform import transform
-from load import load_to_dw
+import argparse
 
-def main():
-    csv_path = "data/raw/candidates.csv"
+from staging import STAGING_DIR
+
+CSV_PATH = "data/raw/candidates.csv"
+
+# Cada stage importa sus módulos adentro: así "kpis" no carga matplotlib
+# y "extract"/"transform" no cargan psycopg2.
+
+
+def run_extract(args):
+    from extract import extract
 
     print(" Extracting...")
-    raw = extract(csv_path)
+    raw = extract(args.csv)
+    print(f"OK: {len(raw)} filas en {args.csv}")
+    return raw
+
+
+def run_transform(args):
+    from transform import transform
+    from staging import write_staging
+
+    raw = run_extract(args)
+
+    print(" Transforming...")
+    tables = transform(raw)
+
+    write_staging(tables, args.staging)
+    print(f"DONE! Staging listo en {args.staging}")
+
+
+def run_load(args):
+    from staging import read_staging
+    from load import load_to_dw
+
+    tables = read_staging(args.staging)
+
+    print(" Loading to PostgreSQL...")
+    load_to_dw(*tables)
+
+    print("DONE! Data loaded into etl_dw")
+
+
+def run_etl(args):
+    from transform import transform
+    from load import load_to_dw
+
+    raw = run_extract(args)
 
     print(" Transforming...")
     dim_candidate, dim_country, dim_date, dim_seniority, dim_technology, fact_raw = transform(raw)
@@ -16,5 +56,53 @@ def main():
 
     print("DONE! Data loaded into etl_dw")
 
+
+def run_kpis(args):
+    from kpi_visualizations import export_kpis
+
+    export_kpis()
+
+
+def run_render(args):
+    from kpi_visualizations import render
+
+    render()
+
+
+def run_all(args):
+    run_etl(args)
+    run_render(args)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="ETL Workshop — pipeline por stages")
+    parser.set_defaults(func=run_etl, csv=CSV_PATH, staging=STAGING_DIR)
+    sub = parser.add_subparsers(dest="command")
+
+    def add_stage(name, func, help, csv=False, staging=False):
+        p = sub.add_parser(name, help=help)
+        p.set_defaults(func=func)
+        if csv:
+            p.add_argument("--csv", default=CSV_PATH, help="CSV crudo de candidatos")
+        if staging:
+            p.add_argument("--staging", default=STAGING_DIR, help="carpeta de staging")
+
+    add_stage("extract", run_extract, "solo lee y valida el CSV", csv=True)
+    add_stage("transform", run_transform, "extract + transform, guarda dims/fact en staging",
+              csv=True, staging=True)
+    add_stage("load", run_load, "carga el staging a PostgreSQL", staging=True)
+    add_stage("etl", run_etl, "extract + transform + load en memoria (default)", csv=True)
+    add_stage("kpis", run_kpis, "exporta solo los CSV de KPIs (sin gráficas)")
+    add_stage("render", run_render, "genera gráficas + dashboard (y los CSV de KPIs)")
+    add_stage("all", run_all, "etl + render", csv=True)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.func(args)
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
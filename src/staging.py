@@ -0,0 +1,37 @@
+import os
+
+STAGING_DIR = os.path.join("data", "staging")
+
+# Orden igual al que devuelve transform() y recibe load_to_dw()
+STAGING_TABLES = [
+    "dim_candidate", "dim_country", "dim_date",
+    "dim_seniority", "dim_technology", "fact_raw"
+]
+
+
+def write_staging(tables, staging_dir: str = STAGING_DIR):
+    os.makedirs(staging_dir, exist_ok=True)
+    for name, df in zip(STAGING_TABLES, tables):
+        path = os.path.join(staging_dir, f"{name}.csv")
+        df.to_csv(path, index=False)
+        print(f"Saved: {path}")
+
+
+def read_staging(staging_dir: str = STAGING_DIR):
+    import pandas as pd
+
+    tables = []
+    for name in STAGING_TABLES:
+        path = os.path.join(staging_dir, f"{name}.csv")
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"No existe {path}. Corre primero el stage 'transform'.")
+        tables.append(pd.read_csv(path))
+
+    dim_candidate, dim_country, dim_date, dim_seniority, dim_technology, fact_raw = tables
+
+    # El CSV pierde los tipos: los mapas de keys en load comparan contra date de Postgres
+    dim_date["application_date"] = pd.to_datetime(dim_date["application_date"]).dt.date
+    fact_raw["Application Date"] = pd.to_datetime(fact_raw["Application Date"])
+    fact_raw["application_date"] = pd.to_datetime(fact_raw["application_date"]).dt.date
+
+    return dim_candidate, dim_country, dim_date, dim_seniority, dim_technology, fact_raw